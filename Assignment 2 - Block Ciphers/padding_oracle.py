@@ -0,0 +1,164 @@
+# package imports
+import multiprocessing
+import os
+import time
+from datetime import timedelta
+
+import task2
+from task2 import submit, verify_strict, unpad_strict, BLOCK_SIZE
+
+def init_server(key, IV):
+    """
+    Pool initializer that gives a worker the same server key and IV as the parent.
+    Without it a spawned worker re-imports task2 and gets a brand new random key.
+    """
+    task2.key = key
+    task2.IV = IV
+
+def padding_oracle(cipherText):
+    """
+    The only thing the attacker learns from the server: was the padding valid?
+    verify_strict() raises ValueError on malformed PKCS#7, anything else means it was fine.
+    """
+    try:
+        verify_strict(cipherText)
+        return True
+    except ValueError:
+        return False
+
+def query_batch(oracle, cipherTexts):
+    """
+    Send a batch of ciphertexts to the oracle and return one True/False per ciphertext.
+    The local oracle is just called once per ciphertext, so batching only pays off
+    for a remote oracle where this can be swapped for one round trip per batch.
+    Every ciphertext in a batch counts as a query, even the ones after a hit.
+    """
+    return [oracle(cipherText) for cipherText in cipherTexts]
+
+def recover_block(task):
+    """
+    Recover one plaintext block using the padding oracle.
+    Each block only depends on itself and the ciphertext block before it,
+    so every block can be attacked by a different worker at the same time.
+    """
+    block_index, prev_block, block, oracle, batch_size = task
+
+    start_time = time.perf_counter()  # only time the queries, not the worker start-up
+    intermediate = bytearray(BLOCK_SIZE)  # decrypted block before the CBC XOR, i.e. D(block)
+    queries = 0
+
+    # work from the last byte to the first, growing the fake padding by one each time
+    for pos in range(BLOCK_SIZE - 1, -1, -1):
+        pad_value = BLOCK_SIZE - pos
+        crafted = bytearray(BLOCK_SIZE)  # fake previous block we control
+        for j in range(pos + 1, BLOCK_SIZE):
+            crafted[j] = intermediate[j] ^ pad_value  # force the known bytes to decrypt to pad_value
+
+        found = None
+        guess = 0
+        while found is None and guess < 256:
+            # send the next batch of guesses for this byte
+            guesses = range(guess, min(guess + batch_size, 256))
+            batch = []
+            for g in guesses:
+                crafted[pos] = g
+                batch.append(bytes(crafted) + block)
+            results = query_batch(oracle, batch)
+            queries += len(batch)
+
+            for g, valid in zip(guesses, results):
+                if not valid:
+                    continue
+                if pos == BLOCK_SIZE - 1:
+                    # a hit on the last byte could be "\x02\x02" etc. instead of "\x01",
+                    # changing the second to last byte rules that out
+                    crafted[pos] = g
+                    crafted[pos - 1] ^= 1
+                    still_valid = oracle(bytes(crafted) + block)
+                    crafted[pos - 1] ^= 1
+                    queries += 1
+                    if not still_valid:
+                        continue
+                found = g
+                break
+            guess += batch_size
+
+        if found is None:
+            raise ValueError(f"oracle never accepted a guess for block {block_index}, byte {pos}")
+        intermediate[pos] = found ^ pad_value
+
+    plaintext_block = bytes([i ^ p for i, p in zip(intermediate, prev_block)])
+    return block_index, plaintext_block, queries, time.perf_counter() - start_time, os.getpid()
+
+def padding_oracle_attack(cipherText, iv, oracle=padding_oracle, num_processes=None, batch_size=16,
+                          initializer=None, initargs=()):
+    """
+    Recover the plaintext of a CBC ciphertext without the key, only asking the oracle about padding.
+    The oracle is sent to the worker processes, so it has to be a module-level function (no lambdas).
+    initializer/initargs are passed to the Pool to set up the oracle's state in each worker;
+    for the default oracle they default to handing the workers this server's key and IV.
+    Returns the unpadded plaintext and a dict of statistics about the oracle calls.
+    """
+    if len(cipherText) == 0 or len(cipherText) % BLOCK_SIZE != 0:
+        raise ValueError("ciphertext length must be a non-zero multiple of the block size")
+
+    if num_processes is None:
+        # use number of CPU cores - 1 (to leave one core for system)
+        num_processes = max(1, multiprocessing.cpu_count() - 1)
+
+    if oracle is padding_oracle and initializer is None:
+        # spawned workers would otherwise answer for a newly generated key
+        initializer, initargs = init_server, (task2.key, task2.IV)
+
+    # pair each ciphertext block with the block before it (the IV for the first block)
+    blocks = [cipherText[i:i + BLOCK_SIZE] for i in range(0, len(cipherText), BLOCK_SIZE)]
+    prev_blocks = [iv] + blocks[:-1]
+    tasks = [(i, prev_blocks[i], blocks[i], oracle, batch_size) for i in range(len(blocks))]
+
+    start_time = time.time()
+
+    recovered = [None] * len(blocks)
+    total_queries = 0
+    worker_times = {}  # worker pid -> time it spent querying, over all the blocks it handled
+    with multiprocessing.Pool(min(num_processes, len(blocks)), initializer, initargs) as pool:
+        for block_index, plaintext_block, queries, block_time, pid in pool.imap_unordered(recover_block, tasks):
+            recovered[block_index] = plaintext_block
+            total_queries += queries
+            worker_times[pid] = worker_times.get(pid, 0.0) + block_time
+
+    elapsed = time.time() - start_time
+    oracle_time = sum(worker_times.values())  # time spent querying, summed over all workers
+    worker_time = max(worker_times.values())  # time the busiest worker spent querying
+    padded_plaintext = b"".join(recovered)
+
+    stats = {
+        "blocks": len(blocks),
+        "bytes_recovered": len(padded_plaintext),
+        "oracle_calls": total_queries,
+        "elapsed": elapsed,
+        "oracle_time": oracle_time,
+        "worker_time": worker_time,
+        # attacker throughput: all queries over the time the busiest worker spent querying
+        "queries_per_sec": total_queries / worker_time if worker_time > 0 else float("inf"),
+        # same but including pool start-up, the figure a stopwatch would show
+        "wall_queries_per_sec": total_queries / elapsed if elapsed > 0 else float("inf"),
+        "calls_per_byte": total_queries / len(padded_plaintext),
+    }
+    return unpad_strict(padded_plaintext), stats
+
+def main():
+    # encrypt a cookie the normal way, then recover it using only the padding oracle
+    cipherText = submit("padding oracle demo")
+    print(f"Ciphertext ({len(cipherText) // BLOCK_SIZE} blocks): {cipherText.hex()}")
+
+    # the workers play the server and get its key and IV by default; the attack itself only uses the public IV
+    plaintext, stats = padding_oracle_attack(cipherText, task2.IV)
+
+    print(f"Recovered plaintext: {plaintext.decode('utf-8', errors='replace')}")
+    print(f"Oracle calls: {stats['oracle_calls']} ({stats['calls_per_byte']:.1f} per recovered byte)")
+    print(f"Time taken: {timedelta(seconds=stats['elapsed'])} ({stats['wall_queries_per_sec']:.0f} queries/sec wall clock)")
+    print(f"Oracle throughput: {stats['queries_per_sec']:.0f} queries/sec "
+          f"(busiest worker spent {timedelta(seconds=stats['worker_time'])} querying)")
+
+if __name__ == '__main__':
+    main()  # run the main function if script is executed directly
@@ -69,6 +69,17 @@ def unpad(padded_data):
     padding_length = padded_data[-1]  # last byte indicates padding length
     return padded_data[:-padding_length]  # remove padding bytes
 
+def unpad_strict(padded_data):
+    # remove PKCS#7 padding, raising ValueError if the padding is malformed
+    if len(padded_data) == 0 or len(padded_data) % BLOCK_SIZE != 0:
+        raise ValueError("invalid padding")
+    padding_length = padded_data[-1]  # last byte indicates padding length
+    if padding_length < 1 or padding_length > BLOCK_SIZE:
+        raise ValueError("invalid padding")
+    if padded_data[-padding_length:] != bytes([padding_length]) * padding_length:
+        raise ValueError("invalid padding")  # every padding byte must equal the length
+    return padded_data[:-padding_length]  # remove padding bytes
+
 def submit(inputStr = ""):
     # prepare and encrypt user input
     userid = 456
@@ -89,16 +100,27 @@ def submit(inputStr = ""):
     encrypted_str = CBC_encrypt(padded_str, key, IV)  # encrypt with CBC mode
     return encrypted_str
 
-def verify(cipherText):
-    # decrypt and verify the ciphertext
+def check_admin(cipherText, unpad_function):
+    # decrypt the ciphertext, remove the padding with unpad_function and look for the admin flag
     plainText = CBC_decrypt(cipherText, key, IV)  # decrypt with CBC mode
-    unpadded_text = unpad(plainText).decode("utf-8", errors="replace")  # remove padding and convert to string
+    unpadded_text = unpad_function(plainText).decode("utf-8", errors="replace")  # remove padding and convert to string
     
     # decode the URL encoded text
     decoded_text = urllib.parse.unquote(unpadded_text)
 
     return ";admin=true;" in decoded_text
 
+def verify(cipherText):
+    # decrypt and verify the ciphertext
+    return check_admin(cipherText, unpad)
+
+def verify_strict(cipherText):
+    """
+    Same as verify(), but rejects malformed PKCS#7 padding by raising ValueError.
+    This is the padding oracle used by padding_oracle.py.
+    """
+    return check_admin(cipherText, unpad_strict)
+
 def bitflip():
     """
     Performs a targeted CBC bit-flipping attack to make verify() return true.
@@ -4,6 +4,26 @@ from Crypto.Random import get_random_bytes
 from Crypto.Hash import SHA256
 import random
 
+# IETF parameter q (modulus)
+IETF_Q_HEX = """
+B10B8F96 A080E01D DE92DE5E AE5D54EC 52C99FBC FB06A3C6
+9A6A9DCA 52D23B61 6073E286 75A23D18 9838EF1E 2EE652C0
+13ECB4AE A9061123 24975C3C D49B83BF ACCBDD7D 90C4BD70
+98488E9C 219A7372 4EFFD6FA E5644738 FAA31A4F F55BCCC0
+A151AF5F 0DC8B4BD 45BF37DF 365C1A65 E68CFDA7 6D4DA708
+DF1FB2BC 2E4A4371
+""".replace('\n', '').replace(' ', '')
+
+# IETF parameter alpha (generator)
+IETF_ALPHA_HEX = """
+A4D1CBD5 C3FD3412 6765A442 EFB99905 F8104DD2 58AC507F
+D6406CFF 14266D31 266FEA1E 5C41564B 777E690F 5504F213
+160217B4 B01B886A 5E91547F 9E2749F4 D7FBD7D3 B9A92EE1
+909D0D22 63F80A76 A6A24C08 7A091F53 1DBF0A01 69B6A28A
+D662A4D1 8E73AFA3 2D779D59 18D08BC8 858F4DCE F97C2A24
+855E6EEB 22B3B2E5
+""".replace('\n', '').replace(' ', '')
+
 def mod_exp(base, exponent, modulus):
     """Perform modular exponentiation efficiently"""
     return pow(base, exponent, modulus)  # uses built-in power with modulus for efficiency
@@ -72,28 +92,8 @@ def diffie_hellman_real_parameters():
     """Implement Diffie-Hellman with IETF 1024-bit parameters"""
     print("=== Diffie-Hellman with IETF 1024-bit Parameters ===")
     
-    # IETF parameter q (modulus)
-    q_hex = """
-    B10B8F96 A080E01D DE92DE5E AE5D54EC 52C99FBC FB06A3C6
-    9A6A9DCA 52D23B61 6073E286 75A23D18 9838EF1E 2EE652C0
-    13ECB4AE A9061123 24975C3C D49B83BF ACCBDD7D 90C4BD70
-    98488E9C 219A7372 4EFFD6FA E5644738 FAA31A4F F55BCCC0
-    A151AF5F 0DC8B4BD 45BF37DF 365C1A65 E68CFDA7 6D4DA708
-    DF1FB2BC 2E4A4371
-    """.replace('\n', '').replace(' ', '')
-    
-    # IETF parameter alpha (generator)
-    alpha_hex = """
-    A4D1CBD5 C3FD3412 6765A442 EFB99905 F8104DD2 58AC507F
-    D6406CFF 14266D31 266FEA1E 5C41564B 777E690F 5504F213
-    160217B4 B01B886A 5E91547F 9E2749F4 D7FBD7D3 B9A92EE1
-    909D0D22 63F80A76 A6A24C08 7A091F53 1DBF0A01 69B6A28A
-    D662A4D1 8E73AFA3 2D779D59 18D08BC8 858F4DCE F97C2A24
-    855E6EEB 22B3B2E5
-    """.replace('\n', '').replace(' ', '')
-    
-    q = int(q_hex, 16)  # convert hex to integer
-    alpha = int(alpha_hex, 16)  # convert hex to integer
+    q = int(IETF_Q_HEX, 16)  # convert hex to integer
+    alpha = int(IETF_ALPHA_HEX, 16)  # convert hex to integer
     
     print(f"q (modulus) is a {q.bit_length()}-bit number")
     print(f"alpha (generator) is a {alpha.bit_length()}-bit number")
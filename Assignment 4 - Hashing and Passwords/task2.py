@@ -4,11 +4,27 @@ import time
 import multiprocessing
 from datetime import timedelta
 import os
+import string
 
 # download NLTK words corpus if not already downloaded
 nltk.download('words', quiet=True)
 from nltk.corpus import words
 
+# built-in charsets for mask attacks (same placeholders as hashcat)
+MASK_CHARSETS = {
+    'l': string.ascii_lowercase,
+    'u': string.ascii_uppercase,
+    'd': string.digits,
+    's': ' ' + string.punctuation,
+    'a': string.ascii_lowercase + string.ascii_uppercase + string.digits + ' ' + string.punctuation,
+}
+
+# how many candidates a mask worker claims at a time
+MASK_RANGE_SIZE = 64
+
+# largest keyspace the shared 64-bit index counter can hold without wrapping
+MAX_MASK_KEYSPACE = 2**64 - 1
+
 def load_shadow_file(filepath):
     """load the shadow file and parse user entries."""
     try:
@@ -76,6 +92,124 @@ def divide_chunks(word_list, num_chunks):
     
     return chunks
 
+def expand_charset(charset):
+    """Expand built-in placeholders like ?l?d inside a custom charset definition."""
+    expanded = ""
+    i = 0
+    while i < len(charset):
+        if charset[i] == '?' and i + 1 < len(charset):
+            key = charset[i + 1]
+            if key in MASK_CHARSETS:
+                expanded += MASK_CHARSETS[key]
+            elif key == '?':
+                expanded += '?'
+            else:
+                raise ValueError(f"Unknown charset placeholder ?{key} in custom charset")
+            i += 2
+        else:
+            expanded += charset[i]
+            i += 1
+
+    # remove duplicates but keep the order, so every index maps to exactly one candidate
+    return "".join(dict.fromkeys(expanded))
+
+def parse_mask(mask, custom_charsets=None):
+    """
+    Turn a mask like ?l?l?l?l?d?d into a list of charsets, one per character position.
+    ?1-?4 refer to custom_charsets[0]-[3], ?? is a literal '?', anything else is a literal character.
+    """
+    custom_charsets = custom_charsets or []
+    charsets = []
+    i = 0
+    while i < len(mask):
+        if mask[i] == '?':
+            if i + 1 >= len(mask):
+                raise ValueError("Mask ends with an incomplete placeholder '?'")
+            key = mask[i + 1]
+            if key in MASK_CHARSETS:
+                charsets.append(MASK_CHARSETS[key])
+            elif key == '?':
+                charsets.append('?')
+            elif key in '1234':
+                number = int(key)
+                if number > len(custom_charsets) or not custom_charsets[number - 1]:
+                    raise ValueError(f"Mask uses ?{key} but custom charset {key} is not defined")
+                charsets.append(expand_charset(custom_charsets[number - 1]))
+            else:
+                raise ValueError(f"Unknown mask placeholder ?{key}")
+            i += 2
+        else:
+            charsets.append(mask[i])
+            i += 1
+
+    if not charsets:
+        raise ValueError("Mask is empty")
+    return charsets
+
+def mask_keyspace(charsets):
+    """Number of candidates a parsed mask produces."""
+    keyspace = 1
+    for charset in charsets:
+        keyspace *= len(charset)
+    return keyspace
+
+def candidate_at(charsets, index):
+    """
+    Build candidate number 'index' of a parsed mask directly, without generating the ones before it.
+    The index is read as a mixed-radix number where the last position changes fastest.
+    """
+    chars = []
+    remaining = index
+    for charset in reversed(charsets):
+        remaining, digit = divmod(remaining, len(charset))
+        chars.append(charset[digit])
+    if remaining != 0:
+        # anything left over (or a negative index) means the index was outside the keyspace
+        raise ValueError(f"Index {index} is outside the keyspace 0-{mask_keyspace(charsets) - 1}")
+    return "".join(reversed(chars))
+
+def crack_password_mask(user_data, charsets, next_index, end_index, progress_queue, result_queue):
+    """
+    Try to crack a user's password by claiming ranges of mask indices until the keyspace runs out.
+    Every finished range is reported on progress_queue so the run can be resumed exactly.
+    """
+    username, hash_data = user_data
+    
+    hash_data_bytes = hash_data.encode('utf-8') # for bcrypt, we need the hash as bytes
+    start_time = time.time()
+    
+    while True:
+        # claim the next range of indices from the shared counter
+        with next_index.get_lock():
+            start = next_index.value
+            if start >= end_index:
+                break
+            end = min(start + MASK_RANGE_SIZE, end_index)
+            next_index.value = end
+        
+        for index in range(start, end):
+            word = candidate_at(charsets, index)
+            if bcrypt.checkpw(word.encode('utf-8'), hash_data_bytes):
+                end_time = time.time()
+                elapsed = end_time - start_time
+                result_queue.put((username, word, elapsed))
+                return
+        
+        progress_queue.put((start, end))
+    
+    result_queue.put((username, None, time.time() - start_time)) # if no match was found
+
+def resume_point(start_index, finished_ranges):
+    """Lowest index such that every candidate below it has been checked."""
+    resume_index = start_index
+    while resume_index in finished_ranges:
+        resume_index = finished_ranges.pop(resume_index)
+    return resume_index
+
+def estimate_time_per_hash_ms(workfactor):
+    """Estimated single-core time for one bcrypt check at the given workfactor."""
+    return 30 * (2 ** (workfactor - 8))  # Based on given benchmark
+
 def extract_workfactor(hash_data):
     """Extract the workfactor from a bcrypt hash."""
     try:
@@ -87,6 +221,69 @@ def extract_workfactor(hash_data):
     except (ValueError, IndexError):
         return 10  # default if we can't extract
 
+def format_duration(seconds):
+    """Format a time estimate, falling back to years when it is too long for a timedelta."""
+    if seconds >= timedelta.max.total_seconds():
+        return f"{seconds / 31_557_600:,.0f} years"
+    return str(timedelta(seconds=seconds))
+
+def crack_user(user_data, target, worker_args, on_poll=None):
+    """
+    Run one process per entry in worker_args against a single user and wait for a result.
+    Each process runs target(user_data, *args, result_queue). on_poll is called on every
+    pass of the wait loop, e.g. to drain a progress queue.
+    Returns the password (or None) and the time taken.
+    """
+    username, hash_data = user_data
+    user_start_time = time.time() # start timer for this user
+    
+    # create a queue for results
+    result_queue = multiprocessing.Queue()
+    
+    # start processes
+    processes = []
+    for args in worker_args:
+        p = multiprocessing.Process(
+            target=target, 
+            args=(user_data, *args, result_queue)
+        )
+        processes.append(p)
+        p.start()
+    
+    password = None
+    try:
+        # wait for first result or all processes to finish
+        while password is None and any(p.is_alive() for p in processes):
+            if on_poll is not None:
+                on_poll()
+            if not result_queue.empty():
+                result_username, password, process_time = result_queue.get()
+            time.sleep(0.1)  # small sleep to prevent CPU hogging
+    finally:
+        # terminate all processes if password found (or we were interrupted)
+        for p in processes:
+            if p.is_alive():
+                p.terminate()
+    
+    # if we didn't find the password already, check the queue for any final results
+    while password is None and not result_queue.empty():
+        result_username, password, process_time = result_queue.get()
+    
+    total_time = time.time() - user_start_time
+    if password is not None:
+        print(f"PASSWORD FOUND! User: {username}, Password: {password}")
+        print(f"Time taken: {timedelta(seconds=total_time)}")
+    return password, total_time
+
+def print_summary(results):
+    """Print the final summary of cracked passwords."""
+    print("\n===== SUMMARY =====")
+    for username, (password, time_taken) in results.items():
+        if password:
+            print(f"User: {username}, Password: {password}, Time: {timedelta(seconds=time_taken)}")
+        else:
+            print(f"User: {username}, Password: NOT FOUND, Time: {timedelta(seconds=time_taken)}")
+
 def crack_all_passwords(shadow_file, num_processes=None):
     """Crack all passwords in the shadow file using multiprocessing."""
     if num_processes is None:
@@ -116,75 +313,107 @@ def crack_all_passwords(shadow_file, num_processes=None):
         
         # extract workfactor to estimate time
         workfactor = extract_workfactor(hash_data)
-        estimated_time_per_hash_ms = 30 * (2 ** (workfactor - 8))  # Based on given benchmark
+        estimated_time_per_hash_ms = estimate_time_per_hash_ms(workfactor)
         estimated_total_time_single_core = estimated_time_per_hash_ms * len(filtered_words) / 1000
         estimated_time_with_parallelism = estimated_total_time_single_core / num_processes
         
         print(f"Workfactor: {workfactor}, Est. time per hash: {estimated_time_per_hash_ms:.1f}ms")
         print(f"Est. worst-case time (all words): {timedelta(seconds=estimated_time_with_parallelism)}")
         
-        user_start_time = time.time() # start timer for this user
-        
         # divide dictionary into chunks for parallel processing
         word_chunks = divide_chunks(filtered_words, num_processes)
         
-        # create a queue for results
-        result_queue = multiprocessing.Queue()
+        password, total_time = crack_user(user_data, crack_password, [(chunk,) for chunk in word_chunks])
         
-        # start processes
-        processes = []
-        for chunk in word_chunks:
-            p = multiprocessing.Process(
-                target=crack_password, 
-                args=(user_data, chunk, result_queue)
-            )
-            processes.append(p)
-            p.start()
+        # if no password found
+        if password is None:
+            print(f"No password found for user {username} after checking all words")
+        results[username] = (password, total_time)
+    
+    # print final summary
+    print_summary(results)
+    
+    return results
+
+def crack_all_passwords_mask(shadow_file, mask, custom_charsets=None, num_processes=None,
+                             start_user=0, start_index=0):
+    """
+    Crack all passwords in the shadow file by brute forcing a mask using multiprocessing.
+    Candidates are addressed by index, so a run interrupted on user start_user (0-based)
+    resumes exactly from start_index. Users before start_user are skipped, users after it start at 0.
+    """
+    if num_processes is None:
+        # use number of CPU cores - 1 (to leave one core for system)
+        num_processes = max(1, multiprocessing.cpu_count() - 1)
+    
+    print(f"Using {num_processes} processes for cracking")
+    
+    # load user data from shadow file
+    print(f"Loading shadow file: {shadow_file}")
+    users = load_shadow_file(shadow_file)
+    print(f"Found {len(users)} users")
+    
+    charsets = parse_mask(mask, custom_charsets)
+    keyspace = mask_keyspace(charsets)
+    if keyspace > MAX_MASK_KEYSPACE:
+        raise ValueError(f"Mask keyspace {keyspace:,} is larger than the supported {MAX_MASK_KEYSPACE:,}")
+    if not 0 <= start_user < max(1, len(users)):
+        raise ValueError(f"Start user {start_user} is outside the users 0-{len(users) - 1}")
+    if not 0 <= start_index <= keyspace:
+        raise ValueError(f"Start index {start_index} is outside the keyspace 0-{keyspace}")
+    print(f"Mask {mask} has a keyspace of {keyspace:,} candidates")
+    if start_user or start_index:
+        print(f"Resuming from user {start_user+1}/{len(users)} at index {start_index:,}")
+    
+    # throughput estimate for every workfactor in the shadow file before starting
+    print("\nEstimated throughput:")
+    for workfactor in sorted(set(extract_workfactor(hash_data) for _, hash_data in users)):
+        checks_per_second = 1000 / estimate_time_per_hash_ms(workfactor) * num_processes
+        worst_case = keyspace / checks_per_second
+        print(f"Workfactor {workfactor}: {checks_per_second:.1f} checks/sec, "
+              f"est. worst-case time: {format_duration(worst_case)}")
+    
+    # statistics for reporting
+    results = {}
+    
+    # process each user
+    for user_idx, user_data in enumerate(users):
+        if user_idx < start_user:
+            continue  # already finished in the run being resumed
         
-        # wait for first result or all processes to finish
-        found_password = False
-        while not found_password and any(p.is_alive() for p in processes):
-            if not result_queue.empty():
-                result_username, password, process_time = result_queue.get()
-                if password is not None:
-                    found_password = True
-                    user_end_time = time.time()
-                    total_time = user_end_time - user_start_time
-                    print(f"PASSWORD FOUND! User: {result_username}, Password: {password}")
-                    print(f"Time taken: {timedelta(seconds=total_time)}")
-                    results[result_username] = (password, total_time)
-            time.sleep(0.1)  # small sleep to prevent CPU hogging
+        username, hash_data = user_data
+        print(f"\nWorking on user {user_idx+1}/{len(users)}: {username}")
         
-        # terminate all processes if password found
-        for p in processes:
-            if p.is_alive():
-                p.terminate()
+        # only the interrupted user resumes part way, everyone after it starts from the beginning
+        user_start_index = start_index if user_idx == start_user else 0
         
-        # if we didn't find the password already, check the queue for any final results
-        if not found_password:
-            while not result_queue.empty():
-                result_username, password, process_time = result_queue.get()
-                if password is not None:
-                    user_end_time = time.time()
-                    total_time = user_end_time - user_start_time
-                    print(f"PASSWORD FOUND! User: {result_username}, Password: {password}")
-                    print(f"Time taken: {timedelta(seconds=total_time)}")
-                    results[result_username] = (password, total_time)
-                    found_password = True
-                    break
-        
-        # if still no password found
-        if not found_password:
-            print(f"No password found for user {username} after checking all words")
-            results[username] = (None, time.time() - user_start_time)
+        # shared counter the workers claim index ranges from
+        next_index = multiprocessing.Value('Q', user_start_index)
+        progress_queue = multiprocessing.Queue()
+        finished_ranges = {}  # start -> end of every range a worker has fully checked
+        resume = [user_start_index]  # lowest index not yet fully checked, updated while polling
+        
+        def drain_progress():
+            while not progress_queue.empty():
+                start, end = progress_queue.get()
+                finished_ranges[start] = end
+            resume[0] = resume_point(resume[0], finished_ranges)
+        
+        worker_args = [(charsets, next_index, keyspace, progress_queue)] * num_processes
+        try:
+            password, total_time = crack_user(user_data, crack_password_mask, worker_args, drain_progress)
+        except KeyboardInterrupt:
+            drain_progress()
+            print(f"\nInterrupted on {username}. Resume with start user {user_idx} and start index {resume[0]}")
+            raise
+        
+        # if no password found
+        if password is None:
+            print(f"No password found for user {username} after checking the whole mask")
+        results[username] = (password, total_time)
     
     # print final summary
-    print("\n===== SUMMARY =====")
-    for username, (password, time_taken) in results.items():
-        if password:
-            print(f"User: {username}, Password: {password}, Time: {timedelta(seconds=time_taken)}")
-        else:
-            print(f"User: {username}, Password: NOT FOUND, Time: {timedelta(seconds=time_taken)}")
+    print_summary(results)
     
     return results
 
@@ -211,5 +440,21 @@ if __name__ == "__main__":
         print(f"Invalid input, using default: {suggested_processes}")
         num_processes = suggested_processes
     
-    # run the password cracker
-    crack_all_passwords(shadow_file, num_processes)
\ No newline at end of file
+    # pick dictionary or mask attack
+    mode = input("Attack mode, dictionary or mask (default: dictionary): ").strip().lower()
+    if mode == "mask":
+        mask = input("Mask, e.g. ?l?l?l?l?d?d: ").strip()
+        custom_charsets = []
+        for number in range(1, 5):
+            if f"?{number}" in mask:
+                custom_charsets.append(input(f"Custom charset {number}, e.g. ?l?d or abc123: "))
+            else:
+                custom_charsets.append("")
+        user_input = input("Start user, 0 for the first user (default: 0): ")
+        start_user = int(user_input) if user_input.strip() else 0
+        start_input = input("Start index (default: 0): ")
+        start_index = int(start_input) if start_input.strip() else 0
+        crack_all_passwords_mask(shadow_file, mask, custom_charsets, num_processes, start_user, start_index)
+    else:
+        # run the password cracker
+        crack_all_passwords(shadow_file, num_processes)
\ No newline at end of file
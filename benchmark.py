@@ -0,0 +1,305 @@
+import argparse
+import importlib.util
+import json
+import multiprocessing
+import os
+import platform
+import random
+import secrets
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import bcrypt
+
+# the assignment folders have spaces in their names, so load the modules by path
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def load_module(name, relative_path):
+    """Import one of the assignment scripts by file path."""
+    path = os.path.join(REPO_DIR, relative_path)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+block_ciphers = load_module("block_ciphers", os.path.join("Assignment 2 - Block Ciphers", "task2.py"))
+public_ciphers = load_module("public_ciphers", os.path.join("Assignment 3 - Public Ciphers", "task1.py"))
+
+# default benchmark settings
+CBC_SIZES = [1024, 16 * 1024, 64 * 1024]  # bytes of plaintext per CBC call
+BCRYPT_COSTS = [8, 10, 12]
+BCRYPT_CHECKS_PER_WORKER = 8
+MIN_TIME = 0.5   # seconds each timing round runs for at least
+ROUNDS = 3       # best of this many rounds is reported
+THRESHOLD = 0.10 # default allowed slowdown before compare flags a regression
+BENCHMARK_GROUPS = ["cbc", "dh", "bcrypt"]
+
+# metadata that has to match for two result files to be comparable
+COMPARABLE_METADATA = ["platform", "cpu_count", "python", "bcrypt"]
+
+def measure(func, min_time=MIN_TIME, rounds=ROUNDS):
+    """
+    Call func repeatedly and return the best calls/sec over several rounds.
+    Each round runs for at least min_time seconds.
+    """
+    best = 0.0
+    for _ in range(rounds):
+        calls = 0
+        start_time = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            func()
+            calls += 1
+            elapsed = time.perf_counter() - start_time
+        best = max(best, calls / elapsed)
+    return best
+
+def bench_block_ciphers(sizes, min_time):
+    """MB/s for CBC_encrypt/CBC_decrypt and pad_text, and blocks/sec for XOR."""
+    results = {}
+    key = secrets.token_bytes(16)
+    iv = secrets.token_bytes(16)
+    block_size = block_ciphers.BLOCK_SIZE
+
+    for size in sizes:
+        data = secrets.token_bytes(size)
+        padded = block_ciphers.pad_text(data, block_size)
+        encrypted = block_ciphers.CBC_encrypt(padded, key, iv)
+        megabytes = size / (1024 * 1024)
+
+        rate = measure(lambda: block_ciphers.CBC_encrypt(padded, key, iv), min_time)
+        results[f"cbc_encrypt_{size}"] = {"value": rate * megabytes, "unit": "MB/s"}
+
+        rate = measure(lambda: block_ciphers.CBC_decrypt(encrypted, key, iv), min_time)
+        results[f"cbc_decrypt_{size}"] = {"value": rate * megabytes, "unit": "MB/s"}
+
+        rate = measure(lambda: block_ciphers.pad_text(data, block_size), min_time)
+        results[f"pad_text_{size}"] = {"value": rate * megabytes, "unit": "MB/s"}
+
+    block1 = secrets.token_bytes(block_size)
+    block2 = secrets.token_bytes(block_size)
+    rate = measure(lambda: block_ciphers.XOR(block1, block2), min_time)
+    results["xor_block"] = {"value": rate, "unit": "blocks/s"}
+    return results
+
+def bench_diffie_hellman(min_time):
+    """Keypair and shared-secret rates for the small and IETF 1024-bit parameters."""
+    results = {}
+    groups = {
+        "small": (37, 5),
+        "ietf1024": (int(public_ciphers.IETF_Q_HEX, 16), int(public_ciphers.IETF_ALPHA_HEX, 16)),
+    }
+
+    for name, (q, alpha) in groups.items():
+        def keypair():
+            X = random.randint(1, q-1)  # private key
+            return public_ciphers.mod_exp(alpha, X, q)  # public value
+
+        XA = random.randint(1, q-1)
+        YB = public_ciphers.mod_exp(alpha, random.randint(1, q-1), q)
+
+        rate = measure(keypair, min_time)
+        results[f"dh_{name}_keypair"] = {"value": rate, "unit": "ops/s"}
+
+        rate = measure(lambda: public_ciphers.mod_exp(YB, XA, q), min_time)
+        results[f"dh_{name}_shared_secret"] = {"value": rate, "unit": "ops/s"}
+    return results
+
+def estimate_time_per_hash_ms(workfactor):
+    """
+    Same estimate as estimate_time_per_hash_ms() in the Assignment 4 cracker.
+    Copied here because importing the cracker downloads the NLTK corpus.
+    """
+    return 30 * (2 ** (workfactor - 8))
+
+def bcrypt_check(hash_data):
+    """One failed password check, the same work the cracker does for a wrong guess."""
+    return bcrypt.checkpw(b"not the password", hash_data)
+
+def bench_bcrypt(costs, worker_counts, checks_per_worker, rounds=ROUNDS):
+    """
+    bcrypt checks/sec for every cost and worker count, next to the cracker's estimate.
+    Like measure(), the best of several timed rounds is reported.
+    """
+    results = {}
+    for cost in costs:
+        hash_data = bcrypt.hashpw(b"password", bcrypt.gensalt(cost))
+        estimated = 1000 / estimate_time_per_hash_ms(cost)  # single core
+
+        for workers in worker_counts:
+            checks = [hash_data] * (checks_per_worker * workers)
+            best = 0.0
+            # the initializer runs one check in every worker, so each one is warmed up
+            with multiprocessing.Pool(workers, bcrypt_check, (hash_data,)) as pool:
+                for _ in range(rounds):
+                    start_time = time.perf_counter()
+                    pool.map(bcrypt_check, checks, chunksize=1)
+                    elapsed = time.perf_counter() - start_time
+                    best = max(best, len(checks) / elapsed)
+
+            results[f"bcrypt_cost{cost}_workers{workers}"] = {
+                "value": best,
+                "unit": "checks/s",
+                "estimated": estimated * workers,
+            }
+    return results
+
+def git_commit():
+    """Current git commit of the repo, or None outside a git checkout."""
+    try:
+        output = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_DIR,
+                                capture_output=True, text=True, check=True)
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def machine_metadata():
+    """Information about the machine the benchmark ran on."""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": multiprocessing.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "bcrypt": getattr(bcrypt, "__version__", None),
+        "git_commit": git_commit(),
+    }
+
+def run(args):
+    """Run the selected benchmarks and write the results to a JSON file."""
+    results = {}
+
+    if "cbc" in args.only:
+        print("Benchmarking CBC, pad_text and XOR...")
+        results.update(bench_block_ciphers(args.sizes, args.min_time))
+    if "dh" in args.only:
+        print("Benchmarking Diffie-Hellman...")
+        results.update(bench_diffie_hellman(args.min_time))
+    if "bcrypt" in args.only:
+        print("Benchmarking bcrypt...")
+        results.update(bench_bcrypt(args.costs, args.workers, args.checks))
+
+    for name, result in results.items():
+        line = f"{name:<32} {result['value']:>14.2f} {result['unit']}"
+        if "estimated" in result:
+            line += f" (estimated {result['estimated']:.2f})"
+        print(line)
+
+    with open(args.output, 'w') as file:
+        json.dump({"metadata": machine_metadata(), "results": results}, file, indent=2)
+    print(f"Results written to {args.output}")
+
+def compare(args):
+    """
+    Compare two result files. Every benchmark is a rate, so a drop of more than
+    the threshold is a regression. Benchmarks missing from the current file and
+    results from different machines also fail unless explicitly allowed.
+    Returns the exit code (1 if anything failed).
+    """
+    with open(args.baseline, 'r') as file:
+        baseline_file = json.load(file)
+    with open(args.current, 'r') as file:
+        current_file = json.load(file)
+    baseline = baseline_file["results"]
+    current = current_file["results"]
+
+    # show where each file came from and check the numbers are comparable
+    baseline_metadata = baseline_file.get("metadata", {})
+    current_metadata = current_file.get("metadata", {})
+    print(f"{'':<16} {'baseline':<40} current")
+    for field in sorted(set(baseline_metadata) | set(current_metadata)):
+        print(f"{field:<16} {str(baseline_metadata.get(field)):<40} {current_metadata.get(field)}")
+    print()
+
+    failures = 0
+    mismatched = [field for field in COMPARABLE_METADATA
+                  if baseline_metadata.get(field) != current_metadata.get(field)]
+    if mismatched:
+        print(f"WARNING: results are from different environments ({', '.join(mismatched)} differ)")
+        if not args.allow_different_machine:
+            failures += 1
+        print()
+
+    regressions = 0
+    missing = 0
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            print(f"{name:<32} MISSING from {args.current}")
+            missing += 1
+            continue
+        if name not in baseline:
+            print(f"{name:<32} new benchmark, {current[name]['value']:.2f} {current[name]['unit']}")
+            continue
+
+        old = baseline[name]["value"]
+        new = current[name]["value"]
+        change = (new - old) / old if old else 0.0
+        status = ""
+        if change < -args.threshold:
+            status = "REGRESSION"
+            regressions += 1
+        print(f"{name:<32} {old:>14.2f} -> {new:>14.2f} {current[name]['unit']:<9} {change:+7.1%} {status}")
+
+    print()
+    if missing:
+        print(f"{missing} benchmark(s) missing from {args.current}")
+        if not args.allow_missing:
+            failures += 1
+    if regressions:
+        print(f"{regressions} benchmark(s) regressed by more than {args.threshold:.0%}")
+        failures += 1
+    else:
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 1 if failures else 0
+
+def benchmark_groups(text):
+    """Parse and validate the comma separated --only list."""
+    groups = [group.strip() for group in text.split(',') if group.strip()]
+    unknown = [group for group in groups if group not in BENCHMARK_GROUPS]
+    if unknown or not groups:
+        raise argparse.ArgumentTypeError(
+            f"unknown benchmark group(s) {', '.join(unknown) or text!r}, choose from {','.join(BENCHMARK_GROUPS)}")
+    return groups
+
+def int_list(text):
+    """Parse a comma separated list of integers from the command line."""
+    return [int(value) for value in text.split(',') if value.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CBC, Diffie-Hellman and bcrypt code.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and save the results as JSON")
+    run_parser.add_argument("-o", "--output", default="benchmark_results.json", help="where to write the results")
+    run_parser.add_argument("--only", type=benchmark_groups, default=BENCHMARK_GROUPS,
+                            help="comma separated subset of cbc,dh,bcrypt")
+    run_parser.add_argument("--sizes", type=int_list, default=CBC_SIZES, help="CBC plaintext sizes in bytes")
+    run_parser.add_argument("--costs", type=int_list, default=BCRYPT_COSTS, help="bcrypt workfactors")
+    run_parser.add_argument("--workers", type=int_list, default=sorted({1, multiprocessing.cpu_count()}),
+                            help="bcrypt worker counts")
+    run_parser.add_argument("--checks", type=int, default=BCRYPT_CHECKS_PER_WORKER,
+                            help="bcrypt checks per worker")
+    run_parser.add_argument("--min-time", type=float, default=MIN_TIME, help="minimum seconds per timing round")
+
+    compare_parser = subparsers.add_parser("compare", help="flag regressions between two result files")
+    compare_parser.add_argument("baseline", help="results to compare against")
+    compare_parser.add_argument("current", help="new results")
+    compare_parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                                help="allowed slowdown as a fraction, e.g. 0.1 for 10%%")
+    compare_parser.add_argument("--allow-missing", action="store_true",
+                                help="don't fail when benchmarks are missing from the current results")
+    compare_parser.add_argument("--allow-different-machine", action="store_true",
+                                help="don't fail when platform, cpu_count, python or bcrypt differ")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+if __name__ == "__main__":
+    main()